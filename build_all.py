@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Build script for every page of the site.
+Loads sidebar.json and renders the shared sidebar/nav/footer fragments
+once, then builds the pages concurrently on a thread pool in this
+process (each page is an independent job sharing the parsed JSON and
+rendered fragments).
+
+Usage:
+    python build_all.py [--precompress] [--quiet] [--force]
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import build_index
+import build_publications
+import build_research
+import build_teaching
+from sidebar import (
+    load_sidebar,
+    parse_build_args,
+    configure_logging,
+    write_static_assets,
+    page_is_current,
+    STATIC_ASSETS,
+    SharedFragments,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Page build entry points, in navigation order
+PAGES = (
+    build_index.main,
+    build_research.main,
+    build_publications.main,
+    build_teaching.main,
+)
+
+
+def main(precompress: bool = False, force: bool = False):
+    """Build all pages in parallel; return the first non-zero page status."""
+    sidebar_path = Path("sidebar.json")
+    
+    logger.info("Loading sidebar from %s...", sidebar_path)
+    try:
+        frags = SharedFragments.build(load_sidebar(sidebar_path))
+    except FileNotFoundError as e:
+        logger.error("Error: %s not found.", e.filename)
+        return 1
+    
+    # The assets depend only on the sidebar; leave them alone when current
+    if force or not all(
+        page_is_current(asset, [sidebar_path], precompress) for asset in STATIC_ASSETS
+    ):
+        write_static_assets(frags, precompress)
+    
+    # Threads rather than processes: rendering a page takes well under a
+    # millisecond, so worker process start-up would dominate the build
+    with ThreadPoolExecutor(max_workers=len(PAGES)) as executor:
+        futures = [
+            executor.submit(build_page, frags, precompress=precompress, force=force)
+            for build_page in PAGES
+        ]
+        statuses = [future.result() for future in futures]
+    
+    return next((status for status in statuses if status), 0)
+
+
+if __name__ == "__main__":
+    args = parse_build_args(__doc__)
+    configure_logging(args.quiet)
+    raise SystemExit(main(precompress=args.precompress, force=args.force))
@@ -4,31 +4,35 @@ Build script for index.html (Biography page).
 Uses sidebar.py for shared components, adds page-specific CSS.
 
 Usage:
-    python build_index.py
+    python build_index.py [--precompress] [--quiet] [--force]
 """
 
-import json
+import logging
 from pathlib import Path
 from typing import Any
 
 from sidebar import (
+    load_json,
     load_sidebar,
-    get_base_head_html,
-    get_nav_html,
-    get_sidebar_html,
-    get_footer_html,
-    get_js_code,
-    get_nav_brand,
+    escape_content,
+    write_page,
+    write_static_assets,
+    page_is_current,
+    parse_build_args,
+    configure_logging,
+    minify_css,
+    SharedFragments,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================
 # PAGE-SPECIFIC CSS
 # ============================================
 
-def get_index_css() -> str:
-    """Return CSS specific to the index/biography page."""
-    return '''
+# CSS specific to the index/biography page, minified once at import
+_INDEX_CSS = minify_css('''
     /* ============================================
        AFFILIATIONS SECTION
        ============================================ */
@@ -169,17 +173,39 @@ def get_index_css() -> str:
     [data-theme="dark"] .sponsor-logo {
       filter: invert(1) hue-rotate(180deg);
     }
-'''
+''')
 
 
 # ============================================
 # CONTENT LOADING
 # ============================================
 
+# Content fields that hold authored HTML (links, emphasis) and are not escaped
+_HTML_FIELDS = frozenset({"bio", "content"})
+
+
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.svg', '.gif', '.webp')
+
+
+def _classify_logos(aff: dict[str, Any]) -> list[tuple[str, bool]]:
+    """Return an affiliation's logos as (src, is_image) pairs."""
+    raw_logos = aff.get("logo_icons", aff.get("logo_icon", "fa-university"))
+    if isinstance(raw_logos, str):
+        raw_logos = [raw_logos]
+    return [(src, src.endswith(_IMAGE_EXTENSIONS)) for src in raw_logos]
+
+
 def load_content(path: Path = Path("content_index.json")) -> dict[str, Any]:
-    """Load page content from JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Load page content from JSON file, HTML-escaping plain-text fields.
+
+    Each affiliation gets a "_logos" list of (src, is_image) pairs, so
+    the image-vs-icon check runs once at load rather than at render.
+    """
+    content = escape_content(load_json(path), _HTML_FIELDS)
+    for aff in content["affiliations"]:
+        aff["_logos"] = _classify_logos(aff)
+    return content
 
 
 # ============================================
@@ -188,36 +214,38 @@ def load_content(path: Path = Path("content_index.json")) -> dict[str, Any]:
 
 def generate_bio_paragraphs(bio: list[str]) -> str:
     """Generate bio paragraphs HTML."""
-    return "\n        ".join(f"<p>{p}</p>" for p in bio)
+    if not bio:
+        return ""
+    return "<p>" + "</p>\n        <p>".join(bio) + "</p>"
 
 
-def generate_affiliations(affiliations: list[dict[str, Any]]) -> str:
-    """Generate affiliations HTML with logo (supports both images and icons)."""
-    items = []
-    for aff in affiliations:
-        dept_lines = "<br>".join(aff.get("department", []))
-
-        raw_logos = aff.get("logo_icons", aff.get("logo_icon", "fa-university"))
-        if isinstance(raw_logos, str):
-            raw_logos = [raw_logos]
-
-        def _logo_el(src, max_width="120px"):
-            if src.endswith(('.png', '.jpg', '.jpeg', '.svg', '.gif', '.webp')):
-                return f'<img src="{src}" alt="" style="max-width:{max_width};width:100%;height:auto;display:block;">'
-            return f'<div class="affiliation-logo"><i class="fas {src}"></i></div>'
-
-        def _logo_img(src, height="50px"):
-            if src.endswith(('.png', '.jpg', '.jpeg', '.svg', '.gif', '.webp')):
-                return f'<img src="{src}" alt="" style="height:{height};width:auto;display:block;">'
-            return f'<div class="affiliation-logo"><i class="fas {src}"></i></div>'
-
-        if len(raw_logos) == 1:
-            logo_html = f'<div style="width:110px;flex-shrink:0;">{_logo_el(raw_logos[0], "110px")}</div>'
-        else:
-            inner = "".join(_logo_img(s, "32px") for s in raw_logos)
-            logo_html = f'<div style="display:flex;flex-direction:row;gap:0.75rem;flex-shrink:0;align-items:center;">{inner}</div>'
-        
-        item = f'''<div class="affiliation-item">
+def _logo_el(src: str, is_image: bool, max_width: str = "120px") -> str:
+    """Generate a single affiliation logo scaled to a maximum width."""
+    if is_image:
+        return f'<img src="{src}" alt="" style="max-width:{max_width};width:100%;height:auto;display:block;">'
+    return f'<div class="affiliation-logo"><i class="fas {src}"></i></div>'
+
+
+def _logo_img(src: str, is_image: bool, height: str = "50px") -> str:
+    """Generate one logo of a multi-logo row scaled to a fixed height."""
+    if is_image:
+        return f'<img src="{src}" alt="" style="height:{height};width:auto;display:block;">'
+    return f'<div class="affiliation-logo"><i class="fas {src}"></i></div>'
+
+
+def generate_affiliation(aff: dict[str, Any]) -> str:
+    """Generate a single affiliation HTML block with its logo(s)."""
+    dept_lines = "<br>".join(aff.get("department", []))
+
+    logos = aff["_logos"]
+    if len(logos) == 1:
+        src, is_image = logos[0]
+        logo_html = f'<div style="width:110px;flex-shrink:0;">{_logo_el(src, is_image, "110px")}</div>'
+    else:
+        inner = "".join(_logo_img(src, is_image, "32px") for src, is_image in logos)
+        logo_html = f'<div style="display:flex;flex-direction:row;gap:0.75rem;flex-shrink:0;align-items:center;">{inner}</div>'
+
+    return f'''<div class="affiliation-item">
           {logo_html}
           <div class="affiliation-info">
             <h3>{aff["institution"]}</h3>
@@ -225,53 +253,51 @@ def generate_affiliations(affiliations: list[dict[str, Any]]) -> str:
             <p class="department">{dept_lines}</p>
           </div>
         </div>'''
-        items.append(item)
-    
-    return "\n        ".join(items)
+
+
+def generate_affiliations(affiliations: list[dict[str, Any]]) -> str:
+    """Generate affiliations HTML with logo (supports both images and icons)."""
+    return "\n        ".join(generate_affiliation(aff) for aff in affiliations)
 
 
 def generate_degrees(degrees: list[dict[str, str]]) -> str:
     """Generate degrees list HTML."""
-    items = []
-    for d in degrees:
-        item = f'<li><strong>{d["degree"]}, {d["field"]},</strong> {d["institution"]}, {d["location"]}</li>'
-        items.append(item)
-    return "\n            ".join(items)
+    return "\n            ".join(
+        f'<li><strong>{d["degree"]}, {d["field"]},</strong> {d["institution"]}, {d["location"]}</li>'
+        for d in degrees
+    )
 
 
 def generate_news(news: list[dict[str, str]]) -> str:
     """Generate news items HTML."""
-    items = []
-    for n in news:
-        item = f'''<li class="news-item">
+    return "\n        ".join(
+        f'''<li class="news-item">
           <span class="news-date">{n["date"]}</span><span class="news-content">{n["content"]}</span>
         </li>'''
-        items.append(item)
-    
-    return "\n        ".join(items)
+        for n in news
+    )
 
 
 def generate_sponsors(sponsors: list[dict[str, str]]) -> str:
     """Generate sponsors/affiliations logos HTML."""
-    items = []
-    for s in sponsors:
-        item = f'<img src="{s["logo"]}" alt="{s["name"]}" class="sponsor-logo">'
-        items.append(item)
-    return "\n          ".join(items)
+    return "\n          ".join(
+        f'<img src="{s["logo"]}" alt="{s["name"]}" class="sponsor-logo">'
+        for s in sponsors
+    )
 
 
 # ============================================
 # PAGE BUILDER
 # ============================================
 
-def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
+def build_html(content: dict[str, Any], frags: SharedFragments) -> str:
     """Build complete HTML page."""
     
     # Get head HTML with page-specific CSS
-    head_html = get_base_head_html(
+    head_html = frags.head_html(
         content["meta"]["title"],
         content["meta"]["description"],
-        get_index_css()
+        _INDEX_CSS
     )
     
     html = f'''<!DOCTYPE html>
@@ -280,12 +306,12 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
 <body>
   <nav>
     <div class="nav-container">
-      <a href="index.html" class="nav-brand">{get_nav_brand(sidebar)}</a>
+      <a href="index.html" class="nav-brand">{frags.nav_brand}</a>
       <button class="nav-toggle" aria-label="Toggle navigation">
         <i class="fas fa-bars"></i>
       </button>
       <ul class="nav-links">
-        {get_nav_html("bio", sidebar)}
+        {frags.nav_html("bio")}
       </ul>
       <button class="theme-toggle" aria-label="Toggle dark mode">
         <i class="fas fa-moon"></i>
@@ -294,7 +320,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   </nav>
 
   <div class="page-wrapper">
-    {get_sidebar_html(sidebar)}
+    {frags.sidebar_html}
 
     <main class="main-content">
       <section class="section">
@@ -332,9 +358,9 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
     </main>
   </div>
 
-  {get_footer_html(sidebar)}
+  {frags.footer_html}
 
-  <script>{get_js_code()}</script>
+  {frags.script_html}
 </body>
 </html>'''
     
@@ -345,36 +371,56 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
 # MAIN
 # ============================================
 
-def main():
-    """Main build function."""
+def main(
+    frags: SharedFragments | None = None,
+    precompress: bool = False,
+    force: bool = False,
+):
+    """
+    Main build function.
+
+    Args:
+        frags: Shared fragments already built by a multi-page driver;
+               built from sidebar.json when omitted.
+        precompress: Also write gzip/brotli copies of the output.
+        force: Rebuild even if the output is newer than its inputs.
+    """
     sidebar_path = Path("sidebar.json")
     content_path = Path("content_index.json")
     output_path = Path("index.html")
     
-    if not sidebar_path.exists():
-        print(f"Error: {sidebar_path} not found.")
-        return 1
+    if not force and page_is_current(
+        output_path,
+        [sidebar_path, content_path, Path(__file__)],
+        precompress,
+        assets=frags is None,
+    ):
+        logger.info("%s is up to date.", output_path)
+        return 0
     
-    if not content_path.exists():
-        print(f"Error: {content_path} not found.")
+    try:
+        if frags is None:
+            logger.info("Loading sidebar from %s...", sidebar_path)
+            frags = SharedFragments.build(load_sidebar(sidebar_path))
+            write_static_assets(frags, precompress)
+        
+        logger.info("Loading content from %s...", content_path)
+        content = load_content(content_path)
+    except FileNotFoundError as e:
+        logger.error("Error: %s not found.", e.filename)
         return 1
     
-    print(f"Loading sidebar from {sidebar_path}...")
-    sidebar = load_sidebar(sidebar_path)
-    
-    print(f"Loading content from {content_path}...")
-    content = load_content(content_path)
-    
-    print("Building index.html...")
-    html = build_html(content, sidebar)
+    logger.info("Building index.html...")
+    html = build_html(content, frags)
     
-    print(f"Writing to {output_path}...")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    logger.info("Writing to %s...", output_path)
+    write_page(output_path, html, precompress)
     
-    print("Done!")
+    logger.info("Wrote %s", output_path)
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    args = parse_build_args(__doc__)
+    configure_logging(args.quiet)
+    raise SystemExit(main(precompress=args.precompress, force=args.force))
\ No newline at end of file
@@ -7,7 +7,7 @@ This script generates the publications page for the academic portfolio,
 displaying papers grouped by year with thumbnails and action links.
 
 Usage:
-    python build_publications.py
+    python build_publications.py [--precompress] [--quiet] [--force]
 
 Required files:
     - sidebar.json: Profile, links, and footer configuration
@@ -16,6 +16,8 @@ Required files:
 
 Output:
     - publications.html: Complete HTML page ready for deployment
+    - publications.html.gz / .br: Precompressed copies (with --precompress)
+    - assets/base.css, assets/app.js: Shared stylesheet and script
 """
 
 # ============================================
@@ -23,21 +25,103 @@ Output:
 # ============================================
 
 # Standard library imports
-import json  # For parsing JSON configuration files
+import logging  # Build progress and error messages
+from dataclasses import dataclass, field  # For fixed-layout content records
 from pathlib import Path  # For cross-platform file path handling
 from typing import Any  # For type hints with generic dictionaries
 
 # Local module imports - shared components from sidebar.py
 from sidebar import (
+    load_json,          # Parse a JSON file (orjson when available)
+    escape_content,     # HTML-escape every string in loaded content
+    write_page,         # Write HTML output (optionally precompressed)
+    write_static_assets,  # Write the shared base.css / app.js files
+    page_is_current,    # Check whether a page is newer than its inputs
+    parse_build_args,   # Parse shared command-line options
+    configure_logging,  # Route build messages to stdout
     load_sidebar,       # Load sidebar.json configuration
-    get_head_html,      # Generate <head> section with CSS
-    get_nav_html,       # Generate navigation links
-    get_sidebar_html,   # Generate left sidebar HTML
-    get_footer_html,    # Generate footer HTML
-    get_js_code,        # Generate JavaScript code
-    get_nav_brand,      # Get brand name for navigation
+    SharedFragments,    # Sidebar/nav/footer/JS HTML shared by all pages
+    minify_css,         # Strip comments/whitespace from static CSS
 )
 
+# Module logger for build progress and errors
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# CONTENT TYPES
+# ============================================
+
+# Records are slotted so render loops read fields by attribute offset
+# rather than dictionary lookup. Constructing them validates the JSON
+# shape: a missing required field or an unknown key raises TypeError at
+# load time instead of a KeyError deep inside an HTML generator.
+
+@dataclass(frozen=True, slots=True)
+class Link:
+    """A labelled link (intro links and per-paper action links)."""
+    label: str                                       # Display text
+    url: str                                         # URL or anchor
+
+
+@dataclass(frozen=True, slots=True)
+class Paper:
+    """A single paper entry from content_publications.json."""
+    title: str                                       # Paper title
+    venue: str                                       # Publication venue
+    authors: str = ""                                # Author string
+    image: str = "assets/img/pub_placeholder.png"    # Thumbnail image path
+    links: list[Link] = field(default_factory=list)  # Action links
+    type: str = ""                                   # Entry type (e.g. abstract)
+    abstract: str = ""                               # Optional abstract text
+
+
+@dataclass(frozen=True, slots=True)
+class YearGroup:
+    """Papers shown together, optionally under a year heading."""
+    papers: list[Paper]                              # Papers in display order
+    year: str = ""                                   # Heading (e.g. "2024")
+
+
+def _load_links(links: list[dict[str, str]], where: str) -> list[Link]:
+    """Convert link dictionaries into Link records."""
+    try:
+        return [Link(**link) for link in links]
+    except TypeError as e:
+        raise ValueError(f"{where} links: {e}") from None
+
+
+def _load_paper(paper: dict[str, Any], where: str) -> Paper:
+    """Convert a paper dictionary into a Paper record."""
+    links = _load_links(paper.get("links", []), where)
+    try:
+        return Paper(**{**paper, "links": links})
+    except TypeError as e:
+        raise ValueError(f"{where}: {e}") from None
+
+
+def _load_year_groups(year_groups: list[dict[str, Any]], section: str) -> list[YearGroup]:
+    """
+    Convert year group dictionaries into YearGroup records.
+    
+    An unknown or missing key raises ValueError naming the entry, e.g.
+    "publications[2] paper 5: ... unexpected keyword argument 'doi'".
+    """
+    records = []
+    for i, year_group in enumerate(year_groups):
+        where = f"{section}[{i}]"
+        fields = {**year_group}
+        if "papers" in fields:
+            fields["papers"] = [
+                _load_paper(paper, f"{where} paper {j}")
+                for j, paper in enumerate(fields["papers"])
+            ]
+        try:
+            records.append(YearGroup(**fields))
+        except TypeError as e:
+            raise ValueError(f"{where}: {e}") from None
+    return records
+
 
 # ============================================
 # CONTENT LOADING FUNCTIONS
@@ -54,72 +138,96 @@ def load_content(path: Path = Path("content_publications.json")) -> dict[str, An
     Returns:
         Dictionary containing publications data including:
         - meta: Page title and description
-        - intro: Introduction text and external links
-        - publications: List of year groups with papers
+        - intro: Introduction text and external Link records
+        - publications: List of YearGroup records
+        - conference_abstracts: List of YearGroup records (may be empty)
+        All strings are HTML-escaped, ready to interpolate into markup.
+    
+    Raises:
+        ValueError: If a link, paper or year group has an unknown or
+                    missing key (the message names the entry).
     """
-    # Open file with UTF-8 encoding for international character support
-    with open(path, "r", encoding="utf-8") as f:
-        # Parse JSON and return as dictionary
-        return json.load(f)
+    # Read raw UTF-8 bytes, parse JSON, and escape every string once
+    content = escape_content(load_json(path))
+    
+    # Convert dictionaries into fixed-layout, validated records
+    content["intro"] = {**content["intro"], "links": _load_links(content["intro"]["links"], "intro")}
+    content["publications"] = _load_year_groups(content["publications"], "publications")
+    content["conference_abstracts"] = _load_year_groups(
+        content.get("conference_abstracts", []), "conference_abstracts"
+    )
+    
+    return content
 
 
 # ============================================
 # HTML GENERATION FUNCTIONS
 # ============================================
 
-def generate_intro_links(links: list[dict[str, str]]) -> str:
+def generate_intro_links(links: list[Link]) -> str:
     """
     Generate introduction links (Google Scholar, Semantic Scholar, etc.).
     
     Args:
-        links: List of link dictionaries containing:
-               - label: Display text for the link
-               - url: URL to link to
+        links: List of Link records (label and URL).
     
     Returns:
         HTML string with formatted links.
     """
-    # Create list of formatted link elements
-    link_elements = []
-    
-    # Iterate through each link
-    for link in links:
-        # Create link with brackets around label
-        link_elements.append(
-            f'<a href="{link["url"]}" target="_blank" rel="noopener">[{link["label"]}]</a>'
-        )
-    
-    # Join links with " / " separator
-    return " / ".join(link_elements)
+    # Create link with brackets around label, joined with " / " separator
+    return " / ".join(
+        f'<a href="{link.url}" target="_blank" rel="noopener">[{link.label}]</a>'
+        for link in links
+    )
 
 
-def generate_paper_links(links: list[dict[str, str]]) -> str:
+def generate_paper_links(links: list[Link]) -> str:
     """
     Generate action links for a paper (abstract, link, bibtex, etc.).
     
     Args:
-        links: List of link dictionaries containing:
-               - label: Link text (e.g., "abstract", "bibtex", "pdf")
-               - url: URL or anchor to link to
+        links: List of Link records, labelled e.g. "abstract", "bibtex", "pdf".
     
     Returns:
         HTML string with pipe-separated links.
     """
-    # Create list of formatted link elements
-    link_elements = []
-    
-    # Iterate through each link
-    for link in links:
-        # Create link with brackets around label, opens in new tab
-        link_elements.append(
-            f'<a href="{link["url"]}" class="paper-link" target="_blank" rel="noopener">[{link["label"]}]</a>'
-        )
-    
-    # Join links with " | " separator (pipe)
-    return " | ".join(link_elements)
+    # Create link with brackets around label, opens in new tab,
+    # joined with " | " separator (pipe)
+    return " | ".join(
+        f'<a href="{link.url}" class="paper-link" target="_blank" rel="noopener">[{link.label}]</a>'
+        for link in links
+    )
+
+
+# Paper entry HTML structures, filled with %-formatting. Fields, in order:
+# [image, title (alt text),] title, authors, venue, links HTML
+_PAPER_WITH_IMAGE_TMPL = '''<div class="paper-item">
+          <div class="paper-image">
+            <img src="%s" alt="%s">
+          </div>
+          <div class="paper-content">
+            <h3 class="paper-title">%s</h3>
+            <p class="paper-authors">%s</p>
+            <p class="paper-venue">%s</p>
+            <div class="paper-links">
+              %s
+            </div>
+          </div>
+        </div>'''
+
+_PAPER_NO_IMAGE_TMPL = '''<div class="paper-item no-image">
+          <div class="paper-content">
+            <h3 class="paper-title">%s</h3>
+            <p class="paper-authors">%s</p>
+            <p class="paper-venue">%s</p>
+            <div class="paper-links">
+              %s
+            </div>
+          </div>
+        </div>'''
 
 
-def generate_paper_html(paper: dict[str, Any], show_image: bool = True) -> str:
+def generate_paper_html(paper: Paper, show_image: bool = True) -> str:
     """
     Generate HTML for a single paper entry.
     
@@ -128,78 +236,48 @@ def generate_paper_html(paper: dict[str, Any], show_image: bool = True) -> str:
     - Title, authors, venue, and action links on the right
     
     Args:
-        paper: Dictionary containing paper data:
-               - title: Paper title
-               - authors: Author string
-               - venue: Publication venue
-               - image: Path to thumbnail image
-               - links: List of action links
-               - abstract: Optional abstract text
+        paper: Paper record (missing image falls back to a placeholder)
         show_image: Whether to display thumbnail image (default True)
     
     Returns:
         HTML string for the paper entry.
     """
-    # Get authors string
-    authors = paper.get("authors", "")
+    # Extract fields used by both layouts
+    title = paper.title
     
     # Generate action links HTML
-    links_html = generate_paper_links(paper.get("links", []))
+    links_html = generate_paper_links(paper.links)
     
     if show_image:
-        # Get thumbnail image path, use placeholder if not provided
-        image = paper.get("image", "assets/img/pub_placeholder.png")
-        
-        # Build paper entry HTML structure with image
-        html = f'''<div class="paper-item">
-          <div class="paper-image">
-            <img src="{image}" alt="{paper["title"]}">
-          </div>
-          <div class="paper-content">
-            <h3 class="paper-title">{paper["title"]}</h3>
-            <p class="paper-authors">{authors}</p>
-            <p class="paper-venue">{paper["venue"]}</p>
-            <div class="paper-links">
-              {links_html}
-            </div>
-          </div>
-        </div>'''
-    else:
-        # Build paper entry HTML structure without image
-        html = f'''<div class="paper-item no-image">
-          <div class="paper-content">
-            <h3 class="paper-title">{paper["title"]}</h3>
-            <p class="paper-authors">{authors}</p>
-            <p class="paper-venue">{paper["venue"]}</p>
-            <div class="paper-links">
-              {links_html}
-            </div>
-          </div>
-        </div>'''
+        # Fill paper entry HTML structure with image
+        return _PAPER_WITH_IMAGE_TMPL % (
+            paper.image, title, title, paper.authors, paper.venue, links_html,
+        )
     
-    return html
+    # Fill paper entry HTML structure without image
+    return _PAPER_NO_IMAGE_TMPL % (title, paper.authors, paper.venue, links_html)
 
 
-def generate_year_section(year_group: dict[str, Any], show_image: bool = True) -> str:
+def generate_year_section(year_group: YearGroup, show_image: bool = True) -> str:
     """
     Generate HTML for a year section containing multiple papers.
     
     Args:
-        year_group: Dictionary containing:
-                   - year: Year label (e.g., "2024", "2021 & Earlier") - OPTIONAL
-                   - papers: List of paper dictionaries
+        year_group: YearGroup record with:
+                   - year: Year label (e.g., "2024", "2021 & Earlier"); empty for none
+                   - papers: List of Paper records
         show_image: Whether to display thumbnail images (default True)
     
     Returns:
         HTML string for the year section.
     """
     # Get year label (optional)
-    year = year_group.get("year", None)
+    year = year_group.year
     
     # Generate HTML for each paper in this year
     papers_html = "\n        ".join(
         generate_paper_html(paper, show_image=show_image) 
-        for paper in year_group["papers"]
+        for paper in year_group.papers
     )
     
     # Build year section HTML structure
@@ -218,32 +296,33 @@ def generate_year_section(year_group: dict[str, Any], show_image: bool = True) -
     return html
 
 
-def generate_publications_html(publications: list[dict[str, Any]]) -> str:
+# Separator between year sections (matches main-content indentation)
+_PUB_SEP = "\n      "
+
+
+def generate_publications_html(publications: list[YearGroup]) -> str:
     """
     Generate HTML for all publication year sections.
     
     Args:
-        publications: List of year group dictionaries.
+        publications: List of YearGroup records.
     
     Returns:
         HTML string with all year sections.
     """
-    # Generate HTML for each year section
-    sections = []
-    
-    for year_group in publications:
-        sections.append(generate_year_section(year_group))
-    
-    # Join all sections with newlines
-    return "\n      ".join(sections)
+    # Generate HTML for each year section, joined with newlines
+    return _PUB_SEP.join(
+        generate_year_section(year_group)
+        for year_group in publications
+    )
 
 
-def generate_conference_abstracts_html(abstracts: list[dict[str, Any]]) -> str:
+def generate_conference_abstracts_html(abstracts: list[YearGroup]) -> str:
     """
     Generate HTML for conference abstracts section.
     
     Args:
-        abstracts: List of year group dictionaries for conference abstracts.
+        abstracts: List of YearGroup records for conference abstracts.
     
     Returns:
         HTML string with conference abstracts sections.
@@ -251,24 +330,20 @@ def generate_conference_abstracts_html(abstracts: list[dict[str, Any]]) -> str:
     if not abstracts:
         return ""
     
-    # Generate HTML for each year section (no images for abstracts)
-    sections = []
-    
-    for year_group in abstracts:
-        sections.append(generate_year_section(year_group, show_image=False))
-    
-    # Join all sections with newlines
-    return "\n      ".join(sections)
+    # Generate HTML for each year section (no images for abstracts),
+    # joined with newlines
+    return _PUB_SEP.join(
+        generate_year_section(year_group, show_image=False)
+        for year_group in abstracts
+    )
 
 
-def get_publications_css() -> str:
-    """
-    Generate additional CSS specific to publications page.
-    
-    Returns:
-        CSS string for publications styling.
-    """
-    return '''
+# ============================================
+# PAGE-SPECIFIC CSS
+# ============================================
+
+# Additional CSS specific to publications page (static, minified once at import)
+_PUBLICATIONS_CSS = minify_css('''
     /* ============================================
        PUBLICATIONS PAGE STYLES
        Styles specific to the publications listing
@@ -445,14 +520,14 @@ def get_publications_css() -> str:
         height: 150px;                 /* Taller height */
       }
     }
-'''
+''')
 
 
 # ============================================
 # MAIN BUILD FUNCTION
 # ============================================
 
-def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
+def build_html(content: dict[str, Any], frags: SharedFragments) -> str:
     """
     Build complete publications HTML page.
     
@@ -466,17 +541,17 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
     
     Args:
         content: Page content dictionary from content_publications.json
-        sidebar: Sidebar configuration dictionary from sidebar.json
+        frags: Shared fragments built from sidebar.json
     
     Returns:
         Complete HTML document as string.
     """
-    # Get base head HTML
-    head_html = get_head_html(content["meta"]["title"], content["meta"]["description"], sidebar)
-    
-    # Insert additional publications CSS before closing </style> tag
-    publications_css = get_publications_css()
-    head_html = head_html.replace("</style>", f"{publications_css}</style>")
+    # Get head HTML with base CSS and publications CSS
+    head_html = frags.head_html(
+        content["meta"]["title"],
+        content["meta"]["description"],
+        _PUBLICATIONS_CSS,
+    )
     
     # Generate introduction links
     intro_links = generate_intro_links(content["intro"]["links"])
@@ -504,7 +579,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   <nav>
     <div class="nav-container">
       <!-- Brand/Logo link to home -->
-      <a href="index.html" class="nav-brand">{get_nav_brand(sidebar)}</a>
+      <a href="index.html" class="nav-brand">{frags.nav_brand}</a>
       
       <!-- Mobile hamburger menu button -->
       <button class="nav-toggle" aria-label="Toggle navigation">
@@ -513,7 +588,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
       
       <!-- Navigation links - publications is active -->
       <ul class="nav-links">
-        {get_nav_html("publications")}
+        {frags.nav_html("publications")}
       </ul>
       
       <!-- Dark/light theme toggle button -->
@@ -526,7 +601,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   <!-- Two-Column Layout Container -->
   <div class="page-wrapper">
     <!-- Left Sidebar with Profile -->
-    {get_sidebar_html(sidebar)}
+    {frags.sidebar_html}
 
     <!-- Main Content Area -->
     <main class="main-content">
@@ -543,10 +618,10 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   </div>
 
   <!-- Page Footer -->
-  {get_footer_html(sidebar)}
+  {frags.footer_html}
 
   <!-- JavaScript for Navigation and Theme Toggle -->
-  <script>{get_js_code()}</script>
+  {frags.script_html}
 </body>
 </html>'''
     
@@ -558,17 +633,29 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
 # MAIN ENTRY POINT
 # ============================================
 
-def main():
+def main(
+    frags: SharedFragments | None = None,
+    precompress: bool = False,
+    force: bool = False,
+):
     """
     Main build function - entry point for script execution.
     
     Performs the following steps:
     1. Define file paths for input and output
-    2. Validate that required input files exist
-    3. Load sidebar configuration from sidebar.json
-    4. Load publications content from content_publications.json
-    5. Build complete HTML document
-    6. Write HTML to publications.html output file
+    2. Load sidebar configuration from sidebar.json and build the shared
+       fragments (skipped when a multi-page driver passes them in)
+    3. Load publications content from content_publications.json
+       (a missing input file or an entry with unknown or missing keys
+       is reported and returns an error code)
+    4. Build complete HTML document
+    5. Write HTML to publications.html output file
+    
+    Args:
+        frags: Shared fragments already built by a multi-page driver,
+               or None to build them from sidebar.json.
+        precompress: Also write gzip/brotli copies of publications.html.
+        force: Rebuild even if the output is newer than its inputs.
     
     Returns:
         0 on success, 1 on error (for use as exit code).
@@ -578,37 +665,51 @@ def main():
     content_path = Path("content_publications.json")  # Page-specific content
     output_path = Path("publications.html")           # Output HTML file
     
-    # Validate sidebar.json exists
-    if not sidebar_path.exists():
-        # Print error message and return error code
-        print(f"Error: {sidebar_path} not found.")
-        return 1
-    
-    # Validate content_publications.json exists
-    if not content_path.exists():
-        # Print error message and return error code
-        print(f"Error: {content_path} not found.")
+    # Skip the build when the outputs (plus the shared assets, when this
+    # is a standalone build that writes them) are newer than every input
+    if not force and page_is_current(
+        output_path,
+        [sidebar_path, content_path, Path(__file__)],
+        precompress,
+        assets=frags is None,
+    ):
+        logger.info("%s is up to date.", output_path)
+        return 0
+    
+    # Load inputs; a missing file surfaces as FileNotFoundError from load_json's stat
+    try:
+        # Load sidebar configuration unless the caller already built it
+        if frags is None:
+            # Load sidebar configuration and render shared fragments
+            logger.info("Loading sidebar from %s...", sidebar_path)
+            frags = SharedFragments.build(load_sidebar(sidebar_path))
+            
+            # Standalone build: also write the shared CSS/JS the page links to
+            write_static_assets(frags, precompress)
+        
+        # Load page content
+        logger.info("Loading content from %s...", content_path)
+        try:
+            content = load_content(content_path)
+        except ValueError as e:
+            # Report the malformed content entry and return error code
+            logger.error("Error: invalid entry in %s: %s", content_path, e)
+            return 1
+    except FileNotFoundError as e:
+        # Report the missing file and return error code
+        logger.error("Error: %s not found.", e.filename)
         return 1
     
-    # Load sidebar configuration
-    print(f"Loading sidebar from {sidebar_path}...")
-    sidebar = load_sidebar(sidebar_path)
-    
-    # Load page content
-    print(f"Loading content from {content_path}...")
-    content = load_content(content_path)
-    
     # Build HTML document
-    print("Building publications.html...")
-    html = build_html(content, sidebar)
+    logger.info("Building publications.html...")
+    html = build_html(content, frags)
     
-    # Write output file
-    print(f"Writing to {output_path}...")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Write output file (encode once, single write)
+    logger.info("Writing to %s...", output_path)
+    write_page(output_path, html, precompress)
     
-    # Print success message
-    print("Done!")
+    # Log success message
+    logger.info("Wrote %s", output_path)
     
     # Return success code
     return 0
@@ -620,5 +721,11 @@ def main():
 
 # Only run main() if this script is executed directly (not imported)
 if __name__ == "__main__":
+    # Parse command-line options
+    args = parse_build_args(__doc__)
+    
+    # Send progress messages (or only errors, with --quiet) to stdout
+    configure_logging(args.quiet)
+    
     # Exit with return code from main()
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main(precompress=args.precompress, force=args.force))
\ No newline at end of file
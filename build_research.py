@@ -7,7 +7,7 @@ This script generates the research page for the academic portfolio,
 displaying research interests and project descriptions with images.
 
 Usage:
-    python build_research.py
+    python build_research.py [--precompress] [--quiet] [--force]
 
 Required files:
     - sidebar.json: Profile, links, and footer configuration
@@ -16,6 +16,8 @@ Required files:
 
 Output:
     - research.html: Complete HTML page ready for deployment
+    - research.html.gz / .br: Precompressed copies (with --precompress)
+    - assets/base.css, assets/app.js: Shared stylesheet and script
 """
 
 # ============================================
@@ -23,26 +25,36 @@ Output:
 # ============================================
 
 # Standard library imports
-import json  # For parsing JSON configuration files
+import logging  # Build progress and error messages
 from pathlib import Path  # For cross-platform file path handling
 from typing import Any  # For type hints with generic dictionaries
 
 # Local module imports - shared components from sidebar.py
 from sidebar import (
+    load_json,          # Parse a JSON file (orjson when available)
+    escape_content,     # HTML-escape the strings of loaded JSON content
     load_sidebar,       # Load sidebar.json configuration
-    get_head_html,      # Generate <head> section with CSS
-    get_nav_html,       # Generate navigation links
-    get_sidebar_html,   # Generate left sidebar HTML
-    get_footer_html,    # Generate footer HTML
-    get_js_code,        # Generate JavaScript code
-    get_nav_brand,      # Get brand name for navigation
+    SharedFragments,    # Sidebar/nav/footer/JS HTML shared by all pages
+    minify_css,         # Strip comments/whitespace from static CSS
+    write_page,         # Write HTML output (optionally precompressed)
+    write_static_assets,  # Write the shared base.css / app.js files
+    page_is_current,    # Check whether a page is newer than its inputs
+    parse_build_args,   # Shared command-line options
+    configure_logging,  # Route build messages to stdout
 )
 
+# Module logger for build progress and errors
+logger = logging.getLogger(__name__)
+
 
 # ============================================
 # CONTENT LOADING FUNCTIONS
 # ============================================
 
+# Project fields that hold authored HTML (emphasis) and are not escaped
+_HTML_FIELDS = frozenset({"description"})
+
+
 def load_content(path: Path = Path("content_research.json")) -> dict[str, Any]:
     """
     Load research content from JSON file.
@@ -56,30 +68,30 @@ def load_content(path: Path = Path("content_research.json")) -> dict[str, Any]:
         - meta: Page title and description
         - interests: List of research interest keywords
         - projects: List of research project dictionaries
+        Strings are HTML-escaped, except project descriptions, which
+        are authored HTML (e.g. <em> emphasis).
     """
-    # Open file with UTF-8 encoding for international character support
-    with open(path, "r", encoding="utf-8") as f:
-        # Parse JSON and return as dictionary
-        return json.load(f)
+    # Read the whole file in one go and parse JSON into a dictionary
+    content = load_json(path)
+    
+    # Escape every string once at build time; project descriptions keep
+    # their markup (the page meta description is still escaped, so the
+    # projects are escaped separately rather than exempting the key)
+    rest = {key: value for key, value in content.items() if key != "projects"}
+    return {
+        **escape_content(rest),
+        "projects": escape_content(content["projects"], _HTML_FIELDS),
+    }
 
 
 # ============================================
 # HTML GENERATION FUNCTIONS
 # ============================================
 
-def generate_interests_html(interests: list[str]) -> str:
-    """
-    Generate research interests as comma-separated list.
-    
-    Args:
-        interests: List of research interest keywords.
-    
-    Returns:
-        HTML string with formatted interests.
-    """
-    # Join interests with comma and space
-    return ", ".join(interests)
-
+# Build repeated markup with str.join over a generator (or list), never
+# with html += ... in a loop: repeated concatenation is quadratic in the
+# number of projects unless CPython's in-place resize trick happens to
+# apply, and it silently stops applying once another reference exists.
 
 def generate_project_html(project: dict[str, Any]) -> str:
     """
@@ -100,6 +112,10 @@ def generate_project_html(project: dict[str, Any]) -> str:
     Returns:
         HTML string for the project entry.
     """
+    # Get project fields used below
+    title = project["title"]
+    description = project["description"]
+    
     # Get project image path if provided
     image = project.get("image", "")
     
@@ -110,18 +126,17 @@ def generate_project_html(project: dict[str, Any]) -> str:
     image_html = ""
     if image:
         image_html = f'''<div class="project-image" style="width: {image_width}px;">
-            <img src="{image}" alt="{project["title"]}">
+            <img src="{image}" alt="{title}">
           </div>'''
     
-    # Generate description paragraphs
-    desc_html = "\n          ".join(
-        f"<p>{para}</p>" 
-        for para in project["description"]
-    )
+    # Generate description paragraphs (one join; tags go in the separator)
+    desc_html = ""
+    if description:
+        desc_html = "<p>" + "</p>\n          <p>".join(description) + "</p>"
     
     # Build project entry HTML structure
     html = f'''<div class="project-item">
-        <h3 class="project-title">{project["title"]}</h3>
+        <h3 class="project-title">{title}</h3>
         <div class="project-content">
           {image_html}
           <div class="project-description">
@@ -143,24 +158,19 @@ def generate_projects_html(projects: list[dict[str, Any]]) -> str:
     Returns:
         HTML string with all project entries.
     """
-    # Generate HTML for each project
-    project_entries = []
-    
-    for project in projects:
-        project_entries.append(generate_project_html(project))
-    
-    # Join all projects with newlines
-    return "\n      ".join(project_entries)
+    # Generate HTML for each project, joined with newlines
+    return "\n      ".join(
+        generate_project_html(project)
+        for project in projects
+    )
 
 
-def get_research_css() -> str:
-    """
-    Generate additional CSS specific to research page.
-    
-    Returns:
-        CSS string for research page styling.
-    """
-    return '''
+# ============================================
+# PAGE-SPECIFIC CSS
+# ============================================
+
+# Additional CSS specific to research page (static, minified once at import)
+_RESEARCH_CSS = minify_css('''
     /* ============================================
        RESEARCH PAGE STYLES
        Styles specific to the research page
@@ -287,14 +297,14 @@ def get_research_css() -> str:
         margin-bottom: 1rem;           /* Space below */
       }
     }
-'''
+''')
 
 
 # ============================================
 # MAIN BUILD FUNCTION
 # ============================================
 
-def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
+def build_html(content: dict[str, Any], frags: SharedFragments) -> str:
     """
     Build complete research HTML page.
     
@@ -308,20 +318,20 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
     
     Args:
         content: Page content dictionary from content_research.json
-        sidebar: Sidebar configuration dictionary from sidebar.json
+        frags: Shared fragments built from sidebar.json
     
     Returns:
         Complete HTML document as string.
     """
-    # Get base head HTML
-    head_html = get_head_html(content["meta"]["title"], content["meta"]["description"], sidebar)
-    
-    # Insert additional research CSS before closing </style> tag
-    research_css = get_research_css()
-    head_html = head_html.replace("</style>", f"{research_css}</style>")
+    # Get head HTML with base CSS and research CSS
+    head_html = frags.head_html(
+        content["meta"]["title"],
+        content["meta"]["description"],
+        _RESEARCH_CSS,
+    )
     
-    # Generate interests HTML
-    interests_html = generate_interests_html(content["interests"])
+    # Research interests as a comma-separated list
+    interests_html = ", ".join(content["interests"])
     
     # Generate projects HTML
     projects_html = generate_projects_html(content["projects"])
@@ -335,7 +345,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   <nav>
     <div class="nav-container">
       <!-- Brand/Logo link to home -->
-      <a href="index.html" class="nav-brand">{get_nav_brand(sidebar)}</a>
+      <a href="index.html" class="nav-brand">{frags.nav_brand}</a>
       
       <!-- Mobile hamburger menu button -->
       <button class="nav-toggle" aria-label="Toggle navigation">
@@ -344,7 +354,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
       
       <!-- Navigation links - research is active -->
       <ul class="nav-links">
-        {get_nav_html("research")}
+        {frags.nav_html("research")}
       </ul>
       
       <!-- Dark/light theme toggle button -->
@@ -357,7 +367,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   <!-- Two-Column Layout Container -->
   <div class="page-wrapper">
     <!-- Left Sidebar with Profile -->
-    {get_sidebar_html(sidebar)}
+    {frags.sidebar_html}
 
     <!-- Main Content Area -->
     <main class="main-content">
@@ -374,10 +384,10 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   </div>
 
   <!-- Page Footer -->
-  {get_footer_html(sidebar)}
+  {frags.footer_html}
 
   <!-- JavaScript for Navigation and Theme Toggle -->
-  <script>{get_js_code()}</script>
+  {frags.script_html}
 </body>
 </html>'''
     
@@ -389,17 +399,28 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
 # MAIN ENTRY POINT
 # ============================================
 
-def main():
+def main(
+    frags: SharedFragments | None = None,
+    precompress: bool = False,
+    force: bool = False,
+):
     """
     Main build function - entry point for script execution.
     
     Performs the following steps:
     1. Define file paths for input and output
-    2. Validate that required input files exist
-    3. Load sidebar configuration from sidebar.json
-    4. Load research content from content_research.json
-    5. Build complete HTML document
-    6. Write HTML to research.html output file
+    2. Load sidebar configuration from sidebar.json and build the shared
+       fragments (skipped when a multi-page driver passes them in)
+    3. Load research content from content_research.json
+       (a missing input file is reported and returns an error code)
+    4. Build complete HTML document
+    5. Write HTML to research.html output file
+    
+    Args:
+        frags: Shared fragments already built by a multi-page driver,
+               or None to build them from sidebar.json.
+        precompress: Also write gzip/brotli copies of research.html.
+        force: Rebuild even if the output is newer than its inputs.
     
     Returns:
         0 on success, 1 on error (for use as exit code).
@@ -409,37 +430,46 @@ def main():
     content_path = Path("content_research.json")  # Page-specific content
     output_path = Path("research.html")           # Output HTML file
     
-    # Validate sidebar.json exists
-    if not sidebar_path.exists():
-        # Print error message and return error code
-        print(f"Error: {sidebar_path} not found.")
-        return 1
-    
-    # Validate content_research.json exists
-    if not content_path.exists():
-        # Print error message and return error code
-        print(f"Error: {content_path} not found.")
+    # Skip the build when the outputs (plus the shared assets, when this
+    # is a standalone build that writes them) are newer than every input
+    if not force and page_is_current(
+        output_path,
+        [sidebar_path, content_path, Path(__file__)],
+        precompress,
+        assets=frags is None,
+    ):
+        logger.info("%s is up to date.", output_path)
+        return 0
+    
+    # Load inputs; a missing file surfaces as FileNotFoundError from load_json's stat
+    try:
+        # Load sidebar configuration unless the caller already built it
+        if frags is None:
+            # Load sidebar configuration and render shared fragments
+            logger.info("Loading sidebar from %s...", sidebar_path)
+            frags = SharedFragments.build(load_sidebar(sidebar_path))
+            
+            # Standalone build: also write the shared CSS/JS the page links to
+            write_static_assets(frags, precompress)
+        
+        # Load page content
+        logger.info("Loading content from %s...", content_path)
+        content = load_content(content_path)
+    except FileNotFoundError as e:
+        # Report the missing file and return error code
+        logger.error("Error: %s not found.", e.filename)
         return 1
     
-    # Load sidebar configuration
-    print(f"Loading sidebar from {sidebar_path}...")
-    sidebar = load_sidebar(sidebar_path)
-    
-    # Load page content
-    print(f"Loading content from {content_path}...")
-    content = load_content(content_path)
-    
     # Build HTML document
-    print("Building research.html...")
-    html = build_html(content, sidebar)
+    logger.info("Building research.html...")
+    html = build_html(content, frags)
     
     # Write output file
-    print(f"Writing to {output_path}...")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    logger.info("Writing to %s...", output_path)
+    write_page(output_path, html, precompress)
     
-    # Print success message
-    print("Done!")
+    # Log success message
+    logger.info("Wrote %s", output_path)
     
     # Return success code
     return 0
@@ -451,5 +481,11 @@ def main():
 
 # Only run main() if this script is executed directly (not imported)
 if __name__ == "__main__":
+    # Parse command-line options
+    args = parse_build_args(__doc__)
+    
+    # Send progress messages (or only errors, with --quiet) to stdout
+    configure_logging(args.quiet)
+    
     # Exit with return code from main()
-    raise SystemExit(main())
+    raise SystemExit(main(precompress=args.precompress, force=args.force))
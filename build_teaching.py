@@ -7,7 +7,7 @@ This script generates the teaching page for the academic portfolio,
 displaying teaching philosophy, courses taught, and mentoring experience.
 
 Usage:
-    python build_teaching.py
+    python build_teaching.py [--precompress] [--quiet] [--force]
 
 Required files:
     - sidebar.json: Profile, links, and footer configuration
@@ -16,6 +16,8 @@ Required files:
 
 Output:
     - teaching.html: Complete HTML page ready for deployment
+    - teaching.html.gz / .br: Precompressed copies (with --precompress)
+    - assets/base.css, assets/app.js: Shared stylesheet and script
 """
 
 # ============================================
@@ -23,21 +25,27 @@ Output:
 # ============================================
 
 # Standard library imports
-import json  # For parsing JSON configuration files
+import logging  # Build progress and error messages
 from pathlib import Path  # For cross-platform file path handling
 from typing import Any  # For type hints with generic dictionaries
 
 # Local module imports - shared components from sidebar.py
 from sidebar import (
+    load_json,          # Parse a JSON file (orjson when available)
+    escape_content,     # HTML-escape the strings of loaded JSON content
     load_sidebar,       # Load sidebar.json configuration
-    get_head_html,      # Generate <head> section with CSS
-    get_nav_html,       # Generate navigation links
-    get_sidebar_html,   # Generate left sidebar HTML
-    get_footer_html,    # Generate footer HTML
-    get_js_code,        # Generate JavaScript code
-    get_nav_brand,      # Get brand name for navigation
+    SharedFragments,    # Sidebar/nav/footer/JS HTML shared by all pages
+    minify_css,         # Strip comments/whitespace from static CSS
+    write_page,         # Write HTML output (optionally precompressed)
+    write_static_assets,  # Write the shared base.css / app.js files
+    page_is_current,    # Check whether a page is newer than its inputs
+    parse_build_args,   # Shared command-line options
+    configure_logging,  # Route build messages to stdout
 )
 
+# Module logger for build progress and errors
+logger = logging.getLogger(__name__)
+
 
 # ============================================
 # CONTENT LOADING FUNCTIONS
@@ -57,17 +65,21 @@ def load_content(path: Path = Path("content_teaching.json")) -> dict[str, Any]:
         - philosophy: Teaching philosophy statement
         - courses: List of course role groups
         - mentoring: List of mentoring categories
+        All strings are HTML-escaped, ready to interpolate into markup.
     """
-    # Open file with UTF-8 encoding for international character support
-    with open(path, "r", encoding="utf-8") as f:
-        # Parse JSON and return as dictionary
-        return json.load(f)
+    # Read the whole file in one go, parse JSON, and escape every string once
+    return escape_content(load_json(path))
 
 
 # ============================================
 # HTML GENERATION FUNCTIONS
 # ============================================
 
+# Course lists, role sections and mentoring entries are built with
+# str.join; keep it that way rather than growing a string with += in a
+# loop, which is quadratic in the number of entries outside CPython's
+# fragile in-place concatenation fast path.
+
 def generate_course_html(course: dict[str, Any]) -> str:
     """
     Generate HTML for a single course entry (bullet item).
@@ -85,10 +97,9 @@ def generate_course_html(course: dict[str, Any]) -> str:
     # Join semesters with comma
     semesters = ", ".join(course["semesters"])
     
-    # Build host span if present
-    host_html = ""
-    if "host" in course and course["host"]:
-        host_html = f' <span class="course-host">[Host: {course["host"]}]</span>'
+    # Build host span if present (missing or empty host means none)
+    host = course.get("host")
+    host_html = f' <span class="course-host">[Host: {host}]</span>' if host else ""
     
     # Build course entry HTML - bullet item
     html = f'''<li class="course-list-item">
@@ -124,12 +135,15 @@ def generate_role_section_html(role_group: dict[str, Any]) -> str:
     location = role_group["location"]
     period = role_group["period"]
     description = role_group["description"]
+    courses_list = role_group["courses_list"]
     
-    # Generate HTML for each course in this role
-    courses_html = "\n          ".join(
-        generate_course_html(course)
-        for course in role_group["courses_list"]
-    )
+    # Generate HTML for each course in this role (skipped when there are none)
+    courses_html = ""
+    if courses_list:
+        courses_html = "\n          ".join(
+            generate_course_html(course)
+            for course in courses_list
+        )
     
     # Build department span if present
     department_html = ""
@@ -163,14 +177,11 @@ def generate_courses_html(courses: list[dict[str, Any]]) -> str:
     Returns:
         HTML string with all role sections.
     """
-    # Generate HTML for each role section
-    sections = []
-    
-    for role_group in courses:
-        sections.append(generate_role_section_html(role_group))
-    
-    # Join all sections with newlines
-    return "\n      ".join(sections)
+    # Generate HTML for each role section, joined with newlines
+    return "\n      ".join(
+        generate_role_section_html(role_group)
+        for role_group in courses
+    )
 
 
 def generate_student_html(student: dict[str, str]) -> str:
@@ -208,14 +219,17 @@ def generate_mentoring_category_html(category: dict[str, Any]) -> str:
     Returns:
         HTML string for the mentoring category.
     """
-    # Get category type
+    # Get category fields used below
     category_type = category["type"]
+    students = category["students"]
     
-    # Generate HTML for each student
-    students_html = "\n          ".join(
-        generate_student_html(student)
-        for student in category["students"]
-    )
+    # Generate HTML for each student (skipped when there are none)
+    students_html = ""
+    if students:
+        students_html = "\n          ".join(
+            generate_student_html(student)
+            for student in students
+        )
     
     # Build category section HTML
     html = f'''<div class="mentoring-category">
@@ -242,25 +256,21 @@ def generate_mentoring_html(mentoring: dict[str, Any]) -> str:
     description = mentoring.get("description", "")
     description_html = f'<p class="mentoring-description">{description}</p>' if description else ""
 
-    # Generate HTML for each category
-    categories = []
-    for category in mentoring["groups"]:
-        categories.append(generate_mentoring_category_html(category))
-
-    # Join all categories with newlines
-    categories_html = "\n        ".join(categories)
+    # Generate HTML for each category, joined with newlines
+    categories_html = "\n        ".join(
+        generate_mentoring_category_html(category)
+        for category in mentoring["groups"]
+    )
 
     return f"{description_html}\n        {categories_html}"
 
 
-def get_teaching_css() -> str:
-    """
-    Generate additional CSS specific to teaching page.
-    
-    Returns:
-        CSS string for teaching page styling.
-    """
-    return '''
+# ============================================
+# PAGE-SPECIFIC CSS
+# ============================================
+
+# Additional CSS specific to teaching page (static, minified once at import)
+_TEACHING_CSS = minify_css('''
     /* ============================================
        TEACHING PAGE STYLES
        Styles specific to the teaching page
@@ -433,14 +443,14 @@ def get_teaching_css() -> str:
       color: var(--text-color);        /* Muted color */
       font-style: italic;              /* Italic */
     }
-'''
+''')
 
 
 # ============================================
 # MAIN BUILD FUNCTION
 # ============================================
 
-def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
+def build_html(content: dict[str, Any], frags: SharedFragments) -> str:
     """
     Build complete teaching HTML page.
     
@@ -454,17 +464,17 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
     
     Args:
         content: Page content dictionary from content_teaching.json
-        sidebar: Sidebar configuration dictionary from sidebar.json
+        frags: Shared fragments built from sidebar.json
     
     Returns:
         Complete HTML document as string.
     """
-    # Get base head HTML
-    head_html = get_head_html(content["meta"]["title"], content["meta"]["description"], sidebar)
-    
-    # Insert additional teaching CSS before closing </style> tag
-    teaching_css = get_teaching_css()
-    head_html = head_html.replace("</style>", f"{teaching_css}</style>")
+    # Get head HTML with base CSS and teaching CSS
+    head_html = frags.head_html(
+        content["meta"]["title"],
+        content["meta"]["description"],
+        _TEACHING_CSS,
+    )
     
     # Generate courses HTML
     courses_html = generate_courses_html(content["courses"])
@@ -481,7 +491,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   <nav>
     <div class="nav-container">
       <!-- Brand/Logo link to home -->
-      <a href="index.html" class="nav-brand">{get_nav_brand(sidebar)}</a>
+      <a href="index.html" class="nav-brand">{frags.nav_brand}</a>
       
       <!-- Mobile hamburger menu button -->
       <button class="nav-toggle" aria-label="Toggle navigation">
@@ -490,7 +500,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
       
       <!-- Navigation links - teaching is active -->
       <ul class="nav-links">
-        {get_nav_html("teaching")}
+        {frags.nav_html("teaching")}
       </ul>
       
       <!-- Dark/light theme toggle button -->
@@ -503,7 +513,7 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   <!-- Two-Column Layout Container -->
   <div class="page-wrapper">
     <!-- Left Sidebar with Profile -->
-    {get_sidebar_html(sidebar)}
+    {frags.sidebar_html}
 
     <!-- Main Content Area -->
     <main class="main-content">
@@ -522,10 +532,10 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
   </div>
 
   <!-- Page Footer -->
-  {get_footer_html(sidebar)}
+  {frags.footer_html}
 
   <!-- JavaScript for Navigation and Theme Toggle -->
-  <script>{get_js_code()}</script>
+  {frags.script_html}
 </body>
 </html>'''
     
@@ -537,17 +547,28 @@ def build_html(content: dict[str, Any], sidebar: dict[str, Any]) -> str:
 # MAIN ENTRY POINT
 # ============================================
 
-def main():
+def main(
+    frags: SharedFragments | None = None,
+    precompress: bool = False,
+    force: bool = False,
+):
     """
     Main build function - entry point for script execution.
     
     Performs the following steps:
     1. Define file paths for input and output
-    2. Validate that required input files exist
-    3. Load sidebar configuration from sidebar.json
-    4. Load teaching content from content_teaching.json
-    5. Build complete HTML document
-    6. Write HTML to teaching.html output file
+    2. Load sidebar configuration from sidebar.json and build the shared
+       fragments (skipped when a multi-page driver passes them in)
+    3. Load teaching content from content_teaching.json
+       (a missing input file is reported and returns an error code)
+    4. Build complete HTML document
+    5. Write HTML to teaching.html output file
+    
+    Args:
+        frags: Shared fragments already built by a multi-page driver,
+               or None to build them from sidebar.json.
+        precompress: Also write gzip/brotli copies of teaching.html.
+        force: Rebuild even if the output is newer than its inputs.
     
     Returns:
         0 on success, 1 on error (for use as exit code).
@@ -557,37 +578,46 @@ def main():
     content_path = Path("content_teaching.json")  # Page-specific content
     output_path = Path("teaching.html")           # Output HTML file
     
-    # Validate sidebar.json exists
-    if not sidebar_path.exists():
-        # Print error message and return error code
-        print(f"Error: {sidebar_path} not found.")
+    # Skip the build when the outputs (plus the shared assets, when this
+    # is a standalone build that writes them) are newer than every input
+    if not force and page_is_current(
+        output_path,
+        [sidebar_path, content_path, Path(__file__)],
+        precompress,
+        assets=frags is None,
+    ):
+        logger.info("%s is up to date.", output_path)
+        return 0
+    
+    # Load inputs; a missing file surfaces as FileNotFoundError from load_json's stat
+    try:
+        # Load sidebar configuration unless the caller already built it
+        if frags is None:
+            # Load sidebar configuration and render shared fragments
+            logger.info("Loading sidebar from %s...", sidebar_path)
+            frags = SharedFragments.build(load_sidebar(sidebar_path))
+            
+            # Standalone build: also write the shared CSS/JS the page links to
+            write_static_assets(frags, precompress)
+        
+        # Load page content
+        logger.info("Loading content from %s...", content_path)
+        content = load_content(content_path)
+    except FileNotFoundError as e:
+        # Report the missing file and return error code
+        logger.error("Error: %s not found.", e.filename)
         return 1
     
-    # Validate content_teaching.json exists
-    if not content_path.exists():
-        # Print error message and return error code
-        print(f"Error: {content_path} not found.")
-        return 1
-    
-    # Load sidebar configuration
-    print(f"Loading sidebar from {sidebar_path}...")
-    sidebar = load_sidebar(sidebar_path)
-    
-    # Load page content
-    print(f"Loading content from {content_path}...")
-    content = load_content(content_path)
-    
     # Build HTML document
-    print("Building teaching.html...")
-    html = build_html(content, sidebar)
+    logger.info("Building teaching.html...")
+    html = build_html(content, frags)
     
     # Write output file
-    print(f"Writing to {output_path}...")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    logger.info("Writing to %s...", output_path)
+    write_page(output_path, html, precompress)
     
-    # Print success message
-    print("Done!")
+    # Log success message
+    logger.info("Wrote %s", output_path)
     
     # Return success code
     return 0
@@ -599,5 +629,11 @@ def main():
 
 # Only run main() if this script is executed directly (not imported)
 if __name__ == "__main__":
+    # Parse command-line options
+    args = parse_build_args(__doc__)
+    
+    # Send progress messages (or only errors, with --quiet) to stdout
+    configure_logging(args.quiet)
+    
     # Exit with return code from main()
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main(precompress=args.precompress, force=args.force))
\ No newline at end of file
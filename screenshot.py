@@ -1,18 +1,69 @@
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, Error as PlaywrightError
+import asyncio
+import hashlib
+import json
 import os
 
-def html_to_png(html_file, output_file, scale=3):
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page(viewport={'width': 1200, 'height': 900}, device_scale_factor=scale)
-        
-        # Convert to absolute path
-        full_path = os.path.abspath(html_file)
-        page.goto(f'file://{full_path}')
-        
-        page.screenshot(path=output_file, full_page=True)
-        browser.close()
-        print(f'Saved: {output_file} ({scale}x resolution)')
+# Remote fonts/stylesheets (Google Fonts, Font Awesome, ...) are saved here on first fetch
+CACHE_DIR = '.screenshot_cache'
+
+async def serve_cached(route):
+    # Serve http(s) requests from disk; fetch and store them the first time they are seen
+    url = route.request.url
+    if not url.startswith(('http://', 'https://')):
+        await route.continue_()
+        return
+
+    key = os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest())
+    if os.path.exists(key + '.json'):
+        with open(key + '.json') as f:
+            meta = json.load(f)
+        await route.fulfill(status=meta['status'], headers=meta['headers'], path=key + '.body')
+        return
+
+    try:
+        response = await route.fetch()
+        body = await response.body() if response.ok else None
+    except PlaywrightError:
+        # Offline, DNS failure or CDN timeout: let the browser try (and fail) on its own,
+        # so the page still renders with fallback fonts instead of hanging in goto
+        await route.continue_()
+        return
+    if response.ok:
+        # The body is read before touching the cache; move each file into place whole,
+        # the .json last since its presence marks the entry as complete
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(key + '.body.tmp', 'wb') as f:
+            f.write(body)
+        os.replace(key + '.body.tmp', key + '.body')
+        with open(key + '.json.tmp', 'w') as f:
+            # The stored body is already decoded, so drop encoding/length headers
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in ('content-encoding', 'content-length')}
+            json.dump({'status': response.status, 'headers': headers}, f)
+        os.replace(key + '.json.tmp', key + '.json')
+    await route.fulfill(response=response)
+
+async def html_to_png(context, html_file, output_file, scale):
+    page = await context.new_page()
+
+    # Convert to absolute path
+    full_path = os.path.abspath(html_file)
+    await page.goto(f'file://{full_path}')
+
+    await page.screenshot(path=output_file, full_page=True)
+    await page.close()
+    print(f'Saved: {output_file} ({scale}x resolution)')
+
+async def html_to_pngs(jobs, scale=3):
+    # Launch Chromium once and capture all (html_file, output_file) pairs concurrently
+    # in one context, so CDN assets are fetched (or read from the cache) once
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        context = await browser.new_context(viewport={'width': 1200, 'height': 900}, device_scale_factor=scale)
+        await context.route('**/*', serve_cached)
+        await asyncio.gather(*(html_to_png(context, html_file, output_file, scale) for html_file, output_file in jobs))
+        await context.close()
+        await browser.close()
 
 # Usage
 
@@ -20,6 +71,8 @@ def html_to_png(html_file, output_file, scale=3):
 # 3 = Recommended (sharp on retina displays)
 # 4 = Best quality (larger file size)
 
-# html_to_png('projects/alzheimers.html', 'assets/research/research_alzheimers.png', 3)
-# html_to_png('projects/copd.html', 'assets/research/research_copd.png', 3)
-# html_to_png('projects/copd_circular.html', 'assets/research/research_copd.png', 3)
\ No newline at end of file
+# asyncio.run(html_to_pngs([
+#     ('projects/alzheimers.html', 'assets/research/research_alzheimers.png'),
+#     ('projects/copd.html', 'assets/research/research_copd.png'),
+# ], 3))
+# asyncio.run(html_to_pngs([('projects/copd_circular.html', 'assets/research/research_copd.png')], 3))
@@ -7,25 +7,261 @@ Page-specific CSS should be added by individual build scripts.
 
 Usage:
     from sidebar import (
+        load_json,
         load_sidebar,
+        escape_content,
+        write_page,
+        write_static_assets,
+        page_is_current,
+        parse_build_args,
+        configure_logging,
         get_base_head_html,
         get_nav_html,
         get_sidebar_html,
         get_footer_html,
         get_js_code,
         get_nav_brand,
+        minify_css,
+        SharedFragments,
     )
 """
 
+import argparse
+import gzip
+import html
 import json
+import logging
+import os
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};])\s*")
+
+
+# Shared stylesheet and script, written once per build and linked from
+# every page so browsers download and cache them once for the whole site.
+BASE_CSS_FILE = Path("assets/base.css")
+APP_JS_FILE = Path("assets/app.js")
+STATIC_ASSETS = (BASE_CSS_FILE, APP_JS_FILE)
+
+
+# Navigation entries: (page_id, href, label, opens_in_new_tab).
+# A None href is filled in with the configured CV file.
+_NAV_PAGES = (
+    ("bio", "index.html", "Biography", False),
+    ("research", "research.html", "Research", False),
+    ("publications", "publications.html", "Publications", False),
+    ("teaching", "teaching.html", "Teaching", False),
+    ("cv", None, "CV", True),
+)
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file; cached per (path, modification time)."""
+    return _json_loads(Path(path).read_bytes())
+
+
+def load_json(path: Path) -> Any:
+    """
+    Parse a UTF-8 JSON file, using orjson when it is installed.
+
+    Results are cached per process and invalidated when the file's
+    modification time changes, so repeated loads during a multi-page
+    build (e.g. sidebar.json) are parsed only once. The returned object
+    is shared between callers and must not be mutated.
+
+    The one stat() for the mtime is also the existence check: a missing
+    file raises FileNotFoundError here, naming the path as given. The
+    cache is keyed on that path as given (the build scripts use fixed
+    paths relative to the site root), so no resolve() is needed.
+    """
+    path = str(path)
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+def escape_content(obj: Any, raw_keys: frozenset[str] = frozenset()) -> Any:
+    """
+    Return a copy of loaded JSON content with every string HTML-escaped.
+
+    Values under keys listed in raw_keys hold authored HTML and are kept
+    as-is. Escaping once after loading lets render code interpolate the
+    remaining fields directly into text and double-quoted attribute
+    positions (all attributes here use double quotes, so apostrophes are
+    left alone). A copy is returned because load_json results are shared.
+    """
+    if isinstance(obj, str):
+        return html.escape(obj, quote=False).replace('"', "&quot;")
+    if isinstance(obj, dict):
+        return {
+            key: value if key in raw_keys else escape_content(value, raw_keys)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [escape_content(value, raw_keys) for value in obj]
+    return obj
 
 
 def load_sidebar(path: Path = Path("sidebar.json")) -> dict[str, Any]:
     """Load sidebar configuration from JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_json(path)
+
+
+def write_page(path: Path, page: str, precompress: bool = False) -> None:
+    """
+    Write a built page as UTF-8 bytes.
+
+    With precompress, also write <path>.gz (and <path>.br when the
+    brotli package is installed) at maximum compression, for servers
+    that serve precompressed files (e.g. nginx gzip_static). GitHub
+    Pages compresses on the fly and does not use them.
+    """
+    # The build is I/O- and memory-bound (JSON bytes in, HTML bytes out),
+    # so the write path matters more than render micro-optimizations:
+    # encode once and hand the whole page to a single write() rather than
+    # streaming it through an 8 KiB text-mode buffer.
+    data = page.encode("utf-8")
+    path.write_bytes(data)
+    if precompress:
+        Path(f"{path}.gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            Path(f"{path}.br").write_bytes(brotli.compress(data, quality=11))
+
+
+def write_static_assets(frags: "SharedFragments", precompress: bool = False) -> None:
+    """
+    Write the shared base CSS and JavaScript files that every page links.
+
+    An asset whose bytes (and requested .gz/.br copies) are already on
+    disk is not rewritten; its mtimes are refreshed instead, so
+    page_is_current sees it as up to date without re-encoding or
+    re-compressing anything.
+    """
+    for path, text in ((BASE_CSS_FILE, frags.base_css), (APP_JS_FILE, frags.js_code)):
+        outputs = _page_outputs(path, precompress)
+        try:
+            unchanged = path.read_bytes() == text.encode("utf-8") and all(
+                output.exists() for output in outputs
+            )
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            for output in outputs:
+                os.utime(output)
+        else:
+            write_page(path, text, precompress)
+
+
+def _page_outputs(path: Path, precompress: bool) -> list[Path]:
+    """Files write_page produces for path with the given precompress flag."""
+    outputs = [path]
+    if precompress:
+        outputs.append(Path(f"{path}.gz"))
+        if brotli is not None:
+            outputs.append(Path(f"{path}.br"))
+    return outputs
+
+
+def page_is_current(
+    path: Path,
+    inputs: list[Path],
+    precompress: bool = False,
+    assets: bool = False,
+) -> bool:
+    """
+    Return True if every file write_page would produce for path is newer
+    than all inputs (and this module), make-style.
+
+    With assets, the shared STATIC_ASSETS count as outputs too, for
+    standalone page builds that write them. A missing output means the
+    page must be built; a missing input is treated as changed so the
+    build runs and reports it.
+    """
+    outputs = _page_outputs(path, precompress)
+    if assets:
+        for asset in STATIC_ASSETS:
+            outputs += _page_outputs(asset, precompress)
+    try:
+        newest_input = max(
+            Path(source).stat().st_mtime_ns for source in (*inputs, __file__)
+        )
+        oldest_output = min(output.stat().st_mtime_ns for output in outputs)
+    except FileNotFoundError:
+        return False
+    return oldest_output >= newest_input
+
+
+def parse_build_args(description: str = None) -> argparse.Namespace:
+    """Parse the command-line options shared by the build scripts."""
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="also write .gz (and .br, if brotli is installed) copies of each page",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="suppress progress messages (errors are still reported)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if the output is newer than its inputs",
+    )
+    return parser.parse_args()
+
+
+class _UnflushedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes records without flushing after each one.
+
+    This behaves like print(): the stream's own buffering decides when
+    output is written (per line on a terminal, in blocks when piped or
+    redirected), rather than one flushed write per progress message.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(quiet: bool = False) -> None:
+    """
+    Print build log messages to stdout as bare lines.
+
+    Progress is logged at INFO and missing inputs at ERROR; quiet keeps
+    only the errors.
+    """
+    handler = _UnflushedStreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=logging.WARNING if quiet else logging.INFO,
+        handlers=[handler],
+    )
 
 
 def _generate_profile_image(profile: dict[str, str]) -> str:
@@ -35,25 +271,37 @@ def _generate_profile_image(profile: dict[str, str]) -> str:
     return '<i class="fas fa-user"></i>'
 
 
+def _generate_sidebar_link(link: dict[str, Any]) -> str:
+    """Generate one sidebar link item (plain text when it has no URL)."""
+    icon = link.get("icon", "fas fa-link")
+    label = link.get("label", "")
+    url = link.get("url")
+    
+    if url:
+        return (
+            f'<li><a href="{url}" target="_blank" rel="noopener">'
+            f'<i class="{icon}" aria-hidden="true"></i> {label}</a></li>'
+        )
+    return f'<li><i class="{icon}" aria-hidden="true"></i> {label}</li>'
+
+
 def _generate_sidebar_links(links: list[dict[str, Any]]) -> str:
     """Generate sidebar links (vertical list with icons)."""
-    items = []
-    for link in links:
-        icon = link.get("icon", "fas fa-link")
-        label = link.get("label", "")
-        url = link.get("url")
-        
-        if url:
-            items.append(
-                f'<li><a href="{url}" target="_blank" rel="noopener">'
-                f'<i class="{icon}" aria-hidden="true"></i> {label}</a></li>'
-            )
-        else:
-            items.append(
-                f'<li><i class="{icon}" aria-hidden="true"></i> {label}</li>'
-            )
-    
-    return "\n          ".join(items)
+    return "\n          ".join(_generate_sidebar_link(link) for link in links)
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a CSS string.
+
+    This is a build-time pass over the static stylesheets in this repo,
+    not a CSS parser: string values must not contain comment markers or
+    whitespace runs that matter.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
 
 
 def get_nav_brand(sidebar: dict[str, Any]) -> str:
@@ -104,20 +352,21 @@ def get_footer_html(sidebar: dict[str, Any]) -> str:
 def get_nav_html(active_page: str = "bio", sidebar: dict = None) -> str:
     """Generate navigation links with active page highlighted."""
     cv_file = sidebar.get("cv_file", "cv.pdf") if sidebar else "cv.pdf"
-    
-    pages = [
-        ("bio", "index.html", "Biography", False),
-        ("research", "research.html", "Research", False),
-        ("publications", "publications.html", "Publications", False),
-        ("teaching", "teaching.html", "Teaching", False),
-        ("cv", cv_file, "CV", True),
-    ]
-    
+    return _format_nav_html(active_page, cv_file)
+
+
+@lru_cache(maxsize=32)
+def _format_nav_html(active_page: str, cv_file: str) -> str:
+    """
+    Generate navigation links for an already-resolved CV file path.
+
+    Memoized: a site only has a handful of (active_page, cv_file) pairs.
+    """
     links = []
-    for page_id, href, label, new_tab in pages:
+    for page_id, href, label, new_tab in _NAV_PAGES:
         active_class = ' class="active"' if page_id == active_page else ""
         target = ' target="_blank" rel="noopener"' if new_tab else ""
-        links.append(f'<li><a href="{href}"{active_class}{target}>{label}</a></li>')
+        links.append(f'<li><a href="{href or cv_file}"{active_class}{target}>{label}</a></li>')
     
     return "\n        ".join(links)
 
@@ -150,7 +399,27 @@ def get_base_css(sidebar: dict[str, Any] = None) -> str:
     link_color_dark = dark.get("link_color", "#60A5FA")
     link_hover_dark = dark.get("link_hover", "#93C5FD")
     
-    return f'''
+    return _format_base_css(
+        accent_light, accent_hover_light, link_color_light, link_hover_light,
+        accent_dark, accent_hover_dark, link_color_dark, link_hover_dark,
+    )
+
+
+@lru_cache(maxsize=8)
+def _format_base_css(
+    accent_light: str, accent_hover_light: str,
+    link_color_light: str, link_hover_light: str,
+    accent_dark: str, accent_hover_dark: str,
+    link_color_dark: str, link_hover_dark: str,
+) -> str:
+    """
+    Render minified base CSS for resolved theme colors.
+
+    Memoized on the eight colors, so every page of a build (and any
+    caller of the get_base_css/get_base_head_html wrappers) shares one
+    rendered and minified copy per theme.
+    """
+    return minify_css(f'''
     /* ============================================
        CSS VARIABLES
        ============================================ */
@@ -460,7 +729,7 @@ def get_base_css(sidebar: dict[str, Any] = None) -> str:
       .nav-links.active {{ display: flex; }}
       .nav-toggle {{ display: block; }}
     }}
-'''
+''')
 
 
 def get_base_head_html(title: str, description: str, page_css: str = "", sidebar: dict[str, Any] = None) -> str:
@@ -473,6 +742,12 @@ def get_base_head_html(title: str, description: str, page_css: str = "", sidebar
         page_css: Additional CSS for this specific page
         sidebar: Optional sidebar configuration for theme colors
     """
+    base_styles = f"<style>\n{get_base_css(sidebar)}\n  </style>"
+    return _format_head_html(title, description, base_styles, page_css)
+
+
+def _format_head_html(title: str, description: str, base_styles: str, page_css: str = "") -> str:
+    """Generate HTML head around base stylesheet markup (<link> or <style>)."""
     return f'''<head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
@@ -484,9 +759,9 @@ def get_base_head_html(title: str, description: str, page_css: str = "", sidebar
   <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;700&family=Roboto+Slab:wght@400;500;700&display=swap" rel="stylesheet">
   <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
   <link rel="stylesheet" href="https://cdn.jsdelivr.net/gh/jpswalsh/academicons@1/css/academicons.min.css">
+  {base_styles}
   
   <style>
-{get_base_css(sidebar)}
 {page_css}
   </style>
 </head>'''
@@ -494,7 +769,12 @@ def get_base_head_html(title: str, description: str, page_css: str = "", sidebar
 
 def get_js_code() -> str:
     """Return shared JavaScript for navigation and theme toggle."""
-    return '''
+    return _JS_CODE
+
+
+# Shared JavaScript; indentation and blank lines are stripped once at
+# import (line breaks are kept, so statement boundaries are unaffected)
+_JS_CODE = "\n".join(line.strip() for line in '''
     const navToggle = document.querySelector('.nav-toggle');
     const navLinks = document.querySelector('.nav-links');
     navToggle.addEventListener('click', () => navLinks.classList.toggle('active'));
@@ -516,7 +796,76 @@ def get_js_code() -> str:
     navLinks.querySelectorAll('a').forEach(link => {
       link.addEventListener('click', () => navLinks.classList.remove('active'));
     });
-'''
+'''.splitlines() if line.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class SharedFragments:
+    """
+    Sidebar-derived HTML that is identical on every page of the site.
+
+    Build once per sidebar configuration and pass to each page's
+    build_html, so a multi-page build renders these fragments once
+    instead of once per page.
+    """
+    nav_brand: str
+    cv_file: str
+    nav_links: dict[str, str]
+    base_css: str
+    sidebar_html: str
+    footer_html: str
+    js_code: str
+
+    # Tags referencing the files written by write_static_assets
+    stylesheet_html: ClassVar[str] = f'<link rel="stylesheet" href="{BASE_CSS_FILE.as_posix()}">'
+    script_html: ClassVar[str] = f'<script src="{APP_JS_FILE.as_posix()}" defer></script>'
+
+    @classmethod
+    def build(cls, sidebar: dict[str, Any]) -> "SharedFragments":
+        """
+        Return the shared fragments for a sidebar configuration.
+
+        Memoized on the configuration's contents, so repeated builds in
+        one process (e.g. calling several pages' main() without passing
+        frags) render the fragments only once.
+        """
+        return _shared_fragments_for(json.dumps(sidebar, sort_keys=True))
+
+    @classmethod
+    def _render(cls, sidebar: dict[str, Any]) -> "SharedFragments":
+        """Render all shared fragments from a sidebar configuration."""
+        cv_file = sidebar.get("cv_file", "cv.pdf")
+        return cls(
+            nav_brand=get_nav_brand(sidebar),
+            cv_file=cv_file,
+            # Navigation differs per page only by its active link, so
+            # render every variant once up front
+            nav_links={
+                page_id: _format_nav_html(page_id, cv_file)
+                for page_id, *_ in _NAV_PAGES
+            },
+            base_css=get_base_css(sidebar),
+            sidebar_html=get_sidebar_html(sidebar),
+            footer_html=get_footer_html(sidebar),
+            js_code=get_js_code(),
+        )
+
+    def head_html(self, title: str, description: str, page_css: str = "") -> str:
+        """Generate HTML head linking the shared base CSS, plus page-specific CSS."""
+        return _format_head_html(title, description, self.stylesheet_html, page_css)
+
+    def nav_html(self, active_page: str) -> str:
+        """Return navigation links with active page highlighted."""
+        nav = self.nav_links.get(active_page)
+        if nav is None:
+            nav = _format_nav_html(active_page, self.cv_file)
+        return nav
+
+
+@lru_cache(maxsize=8)
+def _shared_fragments_for(sidebar_key: str) -> SharedFragments:
+    """Render shared fragments for a JSON-serialized sidebar configuration."""
+    return SharedFragments._render(json.loads(sidebar_key))
 
 
 # Backward compatibility